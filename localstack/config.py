@@ -623,8 +623,17 @@ LAMBDA_DOCKER_DNS = os.environ.get("LAMBDA_DOCKER_DNS", "").strip()
 LAMBDA_DOCKER_FLAGS = os.environ.get("LAMBDA_DOCKER_FLAGS", "").strip()
 
 # prebuild images before execution? Increased cold start time on the tradeoff of increased time until lambda is ACTIVE
+# the prebuilt images contain the runtime init and are shared by all functions of the same runtime
 LAMBDA_PREBUILD_IMAGES = is_env_true("LAMBDA_PREBUILD_IMAGES")
 
+# comma-separated list of lambda runtimes (e.g. "python3.9,nodejs16.x") whose images are pulled in the background
+# when LocalStack starts (only for the new lambda provider, PROVIDER_OVERRIDE_LAMBDA=asf)
+LAMBDA_PREFETCH_RUNTIMES = [
+    runtime.strip()
+    for runtime in os.environ.get("LAMBDA_PREFETCH_RUNTIMES", "").split(",")
+    if runtime.strip()
+]
+
 # get the lambda runtime executor name
 LAMBDA_RUNTIME_EXECUTOR = os.environ.get("LAMBDA_RUNTIME_EXECUTOR", "").strip()
 
@@ -752,6 +761,7 @@ CONFIG_ENV_VARS = [
     "LAMBDA_FALLBACK_URL",
     "LAMBDA_FORWARD_URL",
     "LAMBDA_JAVA_OPTS",
+    "LAMBDA_PREFETCH_RUNTIMES",
     "LAMBDA_REMOTE_DOCKER",
     "LAMBDA_REMOVE_CONTAINERS",
     "LAMBDA_RUNTIME_EXECUTOR",
@@ -24,3 +24,27 @@ def register_partition_adjusting_proxy_listener():
     from localstack.services.generic_proxy import ArnPartitionRewriteListener, ProxyListener
 
     ProxyListener.DEFAULT_LISTENERS.append(ArnPartitionRewriteListener())
+
+
+def _should_prefetch_lambda_runtimes() -> bool:
+    return (
+        bool(config.LAMBDA_PREFETCH_RUNTIMES)
+        and config.SERVICE_PROVIDER_CONFIG.get_provider("lambda") == "asf"
+    )
+
+
+# Prefetch the lambda runtime images on startup, since the lambda provider itself is only loaded on the first
+# lambda request (unless EAGER_SERVICE_LOADING is set)
+@hooks.on_infra_start(should_load=_should_prefetch_lambda_runtimes)
+def prefetch_lambda_runtimes():
+    from localstack.services.awslambda.invocation.runtime_executor import get_runtime_executor
+
+    get_runtime_executor().prefetch_runtimes()
+
+
+# The lambda provider might never be loaded, so the prefetch has to be stopped independently of it
+@hooks.on_infra_shutdown(should_load=_should_prefetch_lambda_runtimes)
+def stop_lambda_runtime_prefetch():
+    from localstack.services.awslambda.invocation.runtime_executor import get_runtime_executor
+
+    get_runtime_executor().stop_background_tasks()
@@ -1,18 +1,33 @@
+import functools
+import hashlib
+import io
 import json
 import logging
+import os
 import shutil
+import socket
+import stat
 import tempfile
+import threading
 import time
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Dict, Literal, Optional
+from typing import IO, Dict, Literal, Optional
 
 from localstack import config
 from localstack.services.awslambda.invocation.executor_endpoint import (
     ExecutorEndpoint,
     ServiceEndpoint,
 )
-from localstack.services.awslambda.invocation.lambda_models import IMAGE_MAPPING, FunctionVersion
+from localstack.services.awslambda.invocation.lambda_models import (
+    IMAGE_MAPPING,
+    FunctionVersion,
+    VersionIdentifier,
+)
 from localstack.services.awslambda.invocation.runtime_executor import RuntimeExecutor
 from localstack.services.awslambda.lambda_utils import (
     get_container_network_for_lambda,
@@ -20,10 +35,13 @@ from localstack.services.awslambda.lambda_utils import (
 )
 from localstack.services.awslambda.packages import awslambda_runtime_package
 from localstack.utils.archives import unzip
-from localstack.utils.container_utils.container_client import ContainerConfiguration
+from localstack.utils.container_utils.container_client import (
+    ContainerConfiguration,
+    VolumeBind,
+    VolumeMappings,
+)
 from localstack.utils.docker_utils import DOCKER_CLIENT as CONTAINER_CLIENT
-from localstack.utils.net import get_free_tcp_port
-from localstack.utils.strings import truncate
+from localstack.utils.strings import short_uid, truncate
 
 LOG = logging.getLogger(__name__)
 
@@ -34,17 +52,53 @@ IMAGE_PREFIX = "amazon/aws-lambda-"
 
 RAPID_ENTRYPOINT = "/var/rapid/init"
 
+TASK_FOLDER = "/var/task"
+
+# buffer size used when streaming files (e.g. lambda archives) to disk
+COPY_BUFFER_SIZE = 256 * 1024
+# lambda archives up to this size are extracted from memory, larger ones are spooled to a temporary file first
+IN_MEMORY_ARCHIVE_MAX_SIZE = 64 * 1024 * 1024
+
 InitializationType = Literal["on-demand", "provisioned-concurrency"]
 
+# executor for image pulls, which run in parallel to the extraction of the function code
+IMAGE_PULL_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lambda-image-pull")
+# separate executor for the startup prefetch, so the prefetch does not delay the image pulls of created functions
+IMAGE_PREFETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="lambda-image-prefetch"
+)
+# time in seconds to wait for the executor endpoint shutdown when stopping an executor
+ENDPOINT_SHUTDOWN_TIMEOUT = 5.0
+# executor for the deletion of function directories, which does not need to block the caller
+CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lambda-cleanup")
+# locks per image name, preventing concurrent pulls or builds of the same image
+_image_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
+_image_locks_lock = threading.Lock()
+# cached image names known to the docker daemon, as (time of listing, image names)
+_image_list_cache: Optional[tuple[float, set[str]]] = None
+_image_list_cache_lock = threading.Lock()
+# time in seconds after which the cached image names are refreshed
+IMAGE_LIST_CACHE_TTL = 30.0
+# prebuilt runtime images which have already been built by this process
+_built_runtime_images: set[str] = set()
+
+# translation table to make qualified ARNs usable in file paths
+ARN_SANITIZE_TABLE = str.maketrans({":": "_", "$": "_"})
+
+# the function code is not part of the image, so the image can be shared by all functions of a runtime
 LAMBDA_DOCKERFILE = """FROM {base_img}
 COPY aws-lambda-rie {rapid_entrypoint}
-COPY code/ /var/task
 """
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_sanitized_qualified_arn(version_id: VersionIdentifier) -> str:
+    return version_id.qualified_arn().translate(ARN_SANITIZE_TABLE)
+
+
 def get_path_for_function(function_version: FunctionVersion) -> Path:
     return Path(
-        f"{tempfile.gettempdir()}/lambda/{function_version.id.qualified_arn().replace(':', '_').replace('$', '_')}_{function_version.config.internal_revision}/"
+        f"{tempfile.gettempdir()}/lambda/{_get_sanitized_qualified_arn(function_version.id)}_{function_version.config.internal_revision}/"
     )
 
 
@@ -52,10 +106,11 @@ def get_code_path_for_function(function_version: FunctionVersion) -> Path:
     return get_path_for_function(function_version) / "code"
 
 
-def get_image_name_for_function(function_version: FunctionVersion) -> str:
-    return f"localstack/lambda-{function_version.id.qualified_arn().replace(':', '_').replace('$', '_').lower()}"
+def get_path_for_runtime_image(runtime: str) -> Path:
+    return Path(f"{tempfile.gettempdir()}/lambda/runtimes/{runtime}/")
 
 
+@functools.lru_cache(maxsize=32)
 def get_image_for_runtime(runtime: str) -> str:
     postfix = IMAGE_MAPPING.get(runtime)
     if not postfix:
@@ -63,47 +118,357 @@ def get_image_for_runtime(runtime: str) -> str:
     return f"{IMAGE_PREFIX}{postfix}"
 
 
+@functools.lru_cache(maxsize=1)
 def get_runtime_client_path() -> Path:
     installer = awslambda_runtime_package.get_installer()
     return Path(installer.get_executable_path())
 
 
-def prepare_image(target_path: Path, function_version: FunctionVersion) -> None:
-    if not function_version.config.runtime:
+@functools.lru_cache(maxsize=1)
+def get_runtime_client_hash() -> str:
+    hash_obj = hashlib.blake2b(digest_size=16)
+    with get_runtime_client_path().open(mode="rb") as f:
+        while chunk := f.read(COPY_BUFFER_SIZE):
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+def get_dockerfile_for_runtime(runtime: str) -> str:
+    return LAMBDA_DOCKERFILE.format(
+        base_img=get_image_for_runtime(runtime),
+        rapid_entrypoint=RAPID_ENTRYPOINT,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def get_prebuilt_image_name_for_runtime(runtime: str) -> str:
+    # the tag is derived from the image contents, so images built by previous runs can be reused
+    image_hash = hashlib.blake2b(digest_size=16)
+    image_hash.update(get_dockerfile_for_runtime(runtime).encode("utf-8"))
+    image_hash.update(get_runtime_client_hash().encode("utf-8"))
+    return f"localstack/lambda-runtime-{runtime.lower()}:{image_hash.hexdigest()}"
+
+
+def _get_image_lock(image_name: str) -> threading.Lock:
+    with _image_locks_lock:
+        return _image_locks[image_name]
+
+
+def _get_known_images(ttl: float = IMAGE_LIST_CACHE_TTL) -> set[str]:
+    """Returns the image names known to the docker daemon, refreshing the cached list if it is older than ttl"""
+    global _image_list_cache
+    with _image_list_cache_lock:
+        if _image_list_cache is None or time.monotonic() - _image_list_cache[0] > ttl:
+            _image_list_cache = (
+                time.monotonic(),
+                set(CONTAINER_CLIENT.get_docker_image_names(strip_latest=False)),
+            )
+        return _image_list_cache[1]
+
+
+def _add_known_image(image_name: str) -> None:
+    with _image_list_cache_lock:
+        if _image_list_cache is not None:
+            _image_list_cache[1].add(image_name)
+
+
+def pull_image_if_missing(image_name: str) -> None:
+    """
+    Pull the given image, if it is not available locally yet.
+    Concurrent calls for the same image will only pull it once.
+
+    :param image_name: Name of the image to pull
+    """
+    with _get_image_lock(image_name):
+        if image_name not in _get_known_images():
+            CONTAINER_CLIENT.pull_image(image_name)
+            _add_known_image(image_name)
+
+
+def _prefetch_image(image_name: str) -> None:
+    try:
+        pull_image_if_missing(image_name)
+    except Exception as e:
+        LOG.warning("Error while prefetching lambda image %s: %s", image_name, e)
+
+
+def eager_prefetch_images() -> None:
+    """Pull the images of the runtimes configured in LAMBDA_PREFETCH_RUNTIMES in the background"""
+    for runtime in config.LAMBDA_PREFETCH_RUNTIMES:
+        try:
+            image_name = get_image_for_runtime(runtime)
+        except ValueError:
+            LOG.warning("Cannot prefetch image for unsupported lambda runtime %s", runtime)
+            continue
+        IMAGE_PREFETCH_EXECUTOR.submit(_prefetch_image, image_name)
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy the contents of the file src to dst.
+    Prefers kernel-side copies (copy_file_range, which allows reflinks on CoW filesystems, then sendfile),
+    and falls back to a buffered copy in user space if those are not available for the given files.
+
+    :param src: Source file
+    :param dst: Destination file, will be created or truncated
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(in_fd).st_size
+        for copy_chunk in (
+            getattr(os, "copy_file_range", None),
+            lambda i, o, count: os.sendfile(o, i, None, count),
+        ):
+            if not copy_chunk:
+                continue
+            try:
+                while remaining > 0:
+                    copied = copy_chunk(in_fd, out_fd, remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            except OSError as e:
+                LOG.debug("Kernel-side copy of %s to %s not possible: %s", src, dst, e)
+                continue
+            if remaining <= 0:
+                return
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+
+
+def extract_archive(archive: IO[bytes], target_path: Path) -> None:
+    """
+    Extract the given (seekable) zip archive into the target path, preserving file permissions and symlinks.
+    Falls back to `localstack.utils.archives.unzip` for archives `zipfile` cannot handle (e.g. incorrect CRCs).
+
+    :param archive: Binary file object of the zip archive
+    :param target_path: Directory to extract the archive into
+    """
+    try:
+        _extract_zip(archive, target_path)
+    except zipfile.BadZipFile as e:
+        LOG.debug("Unable to extract lambda archive, falling back to unzip: %s", e)
+        archive.seek(0)
+        with NamedTemporaryFile() as file:
+            shutil.copyfileobj(archive, file, COPY_BUFFER_SIZE)
+            file.flush()
+            unzip(file.name, str(target_path))
+
+
+def _extract_zip(archive: IO[bytes], target_path: Path) -> None:
+    target_root = target_path.resolve()
+    symlinks = []
+    with zipfile.ZipFile(archive, "r") as zip_file:
+        for member in zip_file.infolist():
+            out_path = _get_member_path(target_root, member.filename)
+            if not out_path:
+                continue
+            mode = member.external_attr >> 16
+            if stat.S_ISLNK(mode):
+                # symlinks are stored as members containing the link target. They are only created after all
+                # other members are extracted, so no member can be written through them
+                symlinks.append((member.filename, zip_file.read(member).decode("utf-8")))
+                continue
+            # remove symlinks from previous extractions, which would otherwise be written through
+            if out_path.is_symlink():
+                out_path.unlink()
+            if member.is_dir():
+                out_path.mkdir(parents=True, exist_ok=True)
+                continue
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            with zip_file.open(member) as src, open(out_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            os.chmod(out_path, stat.S_IMODE(mode) or 0o777)
+    for name, link_target in symlinks:
+        # check again, as the parent directories may contain symlinks created in this loop
+        link_path = _get_member_path(target_root, name)
+        if not link_path:
+            continue
+        if link_path.is_dir() and not link_path.is_symlink():
+            shutil.rmtree(link_path)
+        else:
+            link_path.unlink(missing_ok=True)
+        link_path.parent.mkdir(parents=True, exist_ok=True)
+        os.symlink(link_target, link_path)
+
+
+def _get_member_path(target_root: Path, name: str) -> Optional[Path]:
+    """
+    Returns the path to extract the archive member with the given name to,
+    or None if the member would be written outside of the (resolved) target root.
+    """
+    # like zipfile, treat absolute member names as relative ones
+    parts = [part for part in name.split("/") if part not in ("", ".")]
+    if parts and ".." not in parts:
+        # the member itself might be a symlink (from a previous extraction), which is replaced, so only its
+        # parent directory needs to resolve to a path within the target root
+        parent_path = target_root.joinpath(*parts[:-1]).resolve()
+        if parent_path == target_root or target_root in parent_path.parents:
+            return parent_path / parts[-1]
+    LOG.warning("Skipping archive member %s, as it is outside of the target directory", name)
+    return None
+
+
+def prepare_image(function_version: FunctionVersion) -> None:
+    """
+    Build the prebuilt image (runtime image including the runtime init) for the runtime of the given function.
+    The image is shared by all functions of the same runtime, and is only built if no image with the same
+    contents exists yet (e.g. from a previous run of LocalStack).
+
+    :param function_version: Function version to prepare the image for
+    """
+    runtime = function_version.config.runtime
+    if not runtime:
         raise NotImplementedError("Custom images are currently not supported")
+    image_name = get_prebuilt_image_name_for_runtime(runtime)
+    with _get_image_lock(image_name):
+        if image_name in _built_runtime_images:
+            return
+        if image_name in _get_known_images():
+            LOG.debug("Reusing existing prebuilt lambda image %s", image_name)
+            _built_runtime_images.add(image_name)
+            return
+        _build_runtime_image(runtime, image_name)
+
+
+def _is_same_file_version(src_stat: os.stat_result, target: Path) -> bool:
+    """Checks whether target is a copy of the file with the given stat, based on its size and modification time"""
+    try:
+        target_stat = target.stat()
+    except FileNotFoundError:
+        return False
+    return (
+        target_stat.st_size == src_stat.st_size and target_stat.st_mtime_ns == src_stat.st_mtime_ns
+    )
+
+
+def _build_runtime_image(runtime: str, image_name: str) -> None:
+    target_path = get_path_for_runtime_image(runtime)
+    target_path.mkdir(parents=True, exist_ok=True)
     src_init = get_runtime_client_path()
-    # copy init file
-    target_init = awslambda_runtime_package.get_installer().get_executable_path()
-    shutil.copy(src_init, target_init)
+    # link (or copy) init file, unless it is unchanged from a previous preparation
+    target_init = target_path / "aws-lambda-rie"
+    src_stat = src_init.stat()
+    if not _is_same_file_version(src_stat, target_init):
+        target_init.unlink(missing_ok=True)
+        try:
+            os.link(src_init, target_init)
+        except OSError as e:
+            LOG.debug("Could not link %s to %s, copying instead: %s", src_init, target_init, e)
+            fast_copy(src_init, target_init)
+            os.utime(target_init, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
     target_init.chmod(0o755)
-    # copy code
-    # create dockerfile
+    # create dockerfile, unless it is unchanged from a previous preparation
     docker_file_path = target_path / "Dockerfile"
-    docker_file = LAMBDA_DOCKERFILE.format(
-        base_img=get_image_for_runtime(function_version.config.runtime),
-        rapid_entrypoint=RAPID_ENTRYPOINT,
-    )
-    with docker_file_path.open(mode="w") as f:
-        f.write(docker_file)
+    docker_file = get_dockerfile_for_runtime(runtime)
+    if not docker_file_path.is_file() or docker_file_path.read_text() != docker_file:
+        with docker_file_path.open(mode="w") as f:
+            f.write(docker_file)
     try:
         CONTAINER_CLIENT.build_image(
             dockerfile_path=str(docker_file_path),
-            image_name=get_image_name_for_function(function_version),
+            image_name=image_name,
         )
+        _built_runtime_images.add(image_name)
+        _add_known_image(image_name)
+        _remove_stale_runtime_images(image_name)
     except Exception as e:
         if LOG.isEnabledFor(logging.DEBUG):
             LOG.exception(
-                "Error while building prebuilt lambda image for '%s'",
-                function_version.qualified_arn,
+                "Error while building prebuilt lambda image for runtime '%s'",
+                runtime,
             )
         else:
             LOG.error(
-                "Error while building prebuilt lambda image for '%s', Error: %s",
-                function_version.qualified_arn,
+                "Error while building prebuilt lambda image for runtime '%s', Error: %s",
+                runtime,
                 e,
             )
 
 
+def _remove_stale_runtime_images(image_name: str) -> None:
+    """
+    Removes other tags of the given prebuilt image, which were built for a previous runtime init
+    or Dockerfile. Images still used by containers are kept.
+    """
+    repository = image_name.rpartition(":")[0]
+    known_images = _get_known_images()
+    with _image_list_cache_lock:
+        stale_images = [
+            known_image
+            for known_image in known_images
+            if known_image.rpartition(":")[0] == repository and known_image != image_name
+        ]
+    for stale_image in stale_images:
+        LOG.debug("Removing stale prebuilt lambda image %s", stale_image)
+        try:
+            CONTAINER_CLIENT.remove_image(stale_image, force=False)
+        except Exception as e:
+            LOG.debug("Unable to remove stale prebuilt lambda image %s: %s", stale_image, e)
+            continue
+        with _image_list_cache_lock:
+            if _image_list_cache is not None:
+                _image_list_cache[1].discard(stale_image)
+
+
+class _PortPool:
+    """
+    Pool of free TCP ports for the executor endpoints.
+    Ports are probed in batches, and a port is not handed out again until it is released.
+    Since other processes can take a pooled port in the meantime, ports are checked again before being handed out.
+    """
+
+    def __init__(self, batch_size: int = 16) -> None:
+        self._batch_size = batch_size
+        self._free_ports: list[int] = []
+        self._used_ports: set[int] = set()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> int:
+        with self._lock:
+            while True:
+                while not self._free_ports:
+                    self._free_ports.extend(self._probe_free_ports())
+                port = self._free_ports.pop()
+                if self._can_bind(port):
+                    self._used_ports.add(port)
+                    return port
+                LOG.debug("Discarding pooled port %s, as it is not free anymore", port)
+
+    def release(self, port: int) -> None:
+        with self._lock:
+            if port in self._used_ports:
+                self._used_ports.remove(port)
+                self._free_ports.append(port)
+
+    def _probe_free_ports(self) -> list[int]:
+        # keep all sockets open while probing, so the OS assigns distinct ports
+        sockets = []
+        try:
+            for _ in range(self._batch_size):
+                tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sockets.append(tcp)
+                tcp.bind(("", 0))
+            ports = [tcp.getsockname()[1] for tcp in sockets]
+        finally:
+            for tcp in sockets:
+                tcp.close()
+        return [
+            port for port in ports if port not in self._used_ports and port not in self._free_ports
+        ]
+
+    @staticmethod
+    def _can_bind(port: int) -> bool:
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as tcp:
+                tcp.bind(("", port))
+            return True
+        except OSError:
+            return False
+
+
+_PORT_POOL = _PortPool()
+
+
 class LambdaRuntimeException(Exception):
     def __init__(self, message: str):
         super().__init__(message)
@@ -126,13 +491,13 @@ class DockerRuntimeExecutor(RuntimeExecutor):
         if not self.function_version.config.runtime:
             raise NotImplementedError("Custom images are currently not supported")
         return (
-            get_image_name_for_function(self.function_version)
+            get_prebuilt_image_name_for_runtime(self.function_version.config.runtime)
             if config.LAMBDA_PREBUILD_IMAGES
             else get_image_for_runtime(self.function_version.config.runtime)
         )
 
     def _build_executor_endpoint(self, service_endpoint: ServiceEndpoint) -> ExecutorEndpoint:
-        port = get_free_tcp_port()
+        port = _PORT_POOL.acquire()
         LOG.debug(
             "Creating service endpoint for function %s executor %s",
             self.function_version.qualified_arn,
@@ -156,13 +521,19 @@ class DockerRuntimeExecutor(RuntimeExecutor):
             network=network,
             entrypoint=RAPID_ENTRYPOINT,
         )
+        # local paths can only be mounted if the docker daemon shares the file system with LocalStack,
+        # otherwise the files have to be copied into the container
+        use_mounts = not config.LAMBDA_REMOTE_DOCKER and not config.is_in_docker
+        if use_mounts:
+            container_config.volumes = self._get_volume_mappings()
         CONTAINER_CLIENT.create_container_from_config(container_config)
-        if not config.LAMBDA_PREBUILD_IMAGES:
+        if not use_mounts:
+            if not config.LAMBDA_PREBUILD_IMAGES:
+                CONTAINER_CLIENT.copy_into_container(
+                    self.id, str(get_runtime_client_path()), RAPID_ENTRYPOINT
+                )
             CONTAINER_CLIENT.copy_into_container(
-                self.id, str(get_runtime_client_path()), RAPID_ENTRYPOINT
-            )
-            CONTAINER_CLIENT.copy_into_container(
-                self.id, f"{str(get_code_path_for_function(self.function_version))}/.", "/var/task"
+                self.id, f"{str(get_code_path_for_function(self.function_version))}/.", TASK_FOLDER
             )
 
         CONTAINER_CLIENT.start_container(self.id)
@@ -171,9 +542,44 @@ class DockerRuntimeExecutor(RuntimeExecutor):
         )
         self.executor_endpoint.container_address = self.ip
 
+    def _get_volume_mappings(self) -> VolumeMappings:
+        # mounted read-only, as the mounts are shared by all executors of the version (and the runtime init by all
+        # executors), and /var/task is read-only in AWS as well
+        volumes = VolumeMappings()
+        volumes.add(
+            VolumeBind(
+                str(get_code_path_for_function(self.function_version)), TASK_FOLDER, options=["ro"]
+            )
+        )
+        if not config.LAMBDA_PREBUILD_IMAGES:
+            volumes.add(
+                VolumeBind(str(get_runtime_client_path()), RAPID_ENTRYPOINT, options=["ro"])
+            )
+        return volumes
+
     def stop(self) -> None:
-        CONTAINER_CLIENT.stop_container(container_name=self.id, timeout=5)
-        CONTAINER_CLIENT.remove_container(container_name=self.id)
+        # the endpoint shutdown is independent of the container, so it is done while waiting for the container stop
+        endpoint_shutdown_thread = threading.Thread(
+            target=self._shutdown_executor_endpoint, name=f"lambda-endpoint-shutdown-{self.id}"
+        )
+        endpoint_shutdown_thread.start()
+        try:
+            # the runtime init has no graceful shutdown, so there is no point in waiting before killing it
+            CONTAINER_CLIENT.stop_container(container_name=self.id, timeout=0)
+            CONTAINER_CLIENT.remove_container(container_name=self.id)
+        finally:
+            endpoint_shutdown_thread.join(timeout=ENDPOINT_SHUTDOWN_TIMEOUT)
+            # if the shutdown did not finish, the endpoint might still be bound to the port
+            if not endpoint_shutdown_thread.is_alive():
+                _PORT_POOL.release(self.executor_endpoint.port)
+            else:
+                LOG.debug(
+                    "Executor endpoint of %s did not shut down in time, not releasing port %s",
+                    self.id,
+                    self.executor_endpoint.port,
+                )
+
+    def _shutdown_executor_endpoint(self) -> None:
         try:
             self.executor_endpoint.shutdown()
         except Exception as e:
@@ -195,11 +601,12 @@ class DockerRuntimeExecutor(RuntimeExecutor):
         return get_container_network_for_lambda()
 
     def invoke(self, payload: Dict[str, str]):
-        LOG.debug(
-            "Sending invoke-payload '%s' to executor '%s'",
-            truncate(json.dumps(payload), config.LAMBDA_TRUNCATE_STDOUT),
-            self.id,
-        )
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(
+                "Sending invoke-payload '%s' to executor '%s'",
+                truncate(json.dumps(payload), config.LAMBDA_TRUNCATE_STDOUT),
+                self.id,
+            )
         self.executor_endpoint.invoke(payload)
 
     @classmethod
@@ -210,23 +617,40 @@ class DockerRuntimeExecutor(RuntimeExecutor):
         # write code to disk
         target_code = get_code_path_for_function(function_version)
         target_code.mkdir(parents=True, exist_ok=True)
-        with NamedTemporaryFile() as file:
-            # TODO use streaming to avoid heavy memory impact of loading zip file, e.g. via s3.download_file
-            file.write(function_version.config.code.get_lambda_archive())
-            file.flush()
-            unzip(file.name, str(target_code))
+        # pull the runtime image in the background while the code is extracted
         image_name = get_image_for_runtime(function_version.config.runtime)
-        if image_name not in CONTAINER_CLIENT.get_docker_image_names(strip_latest=False):
-            CONTAINER_CLIENT.pull_image(image_name)
+        image_pull_future = IMAGE_PULL_EXECUTOR.submit(pull_image_if_missing, image_name)
+        code = function_version.config.code
+        with closing(code.open_lambda_archive()) as archive:
+            if code.code_size <= IN_MEMORY_ARCHIVE_MAX_SIZE:
+                extract_archive(io.BytesIO(archive.read()), target_code)
+            else:
+                with NamedTemporaryFile() as file:
+                    shutil.copyfileobj(archive, file, COPY_BUFFER_SIZE)
+                    file.seek(0)
+                    extract_archive(file, target_code)
+        image_pull_future.result()
         if config.LAMBDA_PREBUILD_IMAGES:
-            prepare_image(target_path, function_version)
+            prepare_image(function_version)
         LOG.debug("Version preparation took %0.2fms", (time.perf_counter() - time_before) * 1000)
 
+    @classmethod
+    def prefetch_runtimes(cls) -> None:
+        eager_prefetch_images()
+
+    @classmethod
+    def stop_background_tasks(cls) -> None:
+        # running pulls cannot be interrupted, but queued ones would otherwise delay the interpreter exit
+        IMAGE_PREFETCH_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        IMAGE_PULL_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
     @classmethod
     def cleanup_version(cls, function_version: FunctionVersion) -> None:
         function_path = get_path_for_function(function_version)
+        # move the directory out of the way first, so the (potentially slow) deletion can happen in the background
+        deletion_path = function_path.with_name(f"{function_path.name}.deleting-{short_uid()}")
         try:
-            shutil.rmtree(function_path)
+            function_path.rename(deletion_path)
         except OSError as e:
             LOG.debug(
                 "Could not cleanup function %s due to error %s while deleting file %s",
@@ -234,5 +658,5 @@ class DockerRuntimeExecutor(RuntimeExecutor):
                 e.strerror,
                 e.filename,
             )
-        if config.LAMBDA_PREBUILD_IMAGES:
-            CONTAINER_CLIENT.remove_image(get_image_name_for_function(function_version))
+            return
+        CLEANUP_EXECUTOR.submit(shutil.rmtree, deletion_path, ignore_errors=True)
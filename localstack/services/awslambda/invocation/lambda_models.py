@@ -2,8 +2,9 @@ import abc
 import dataclasses
 import logging
 import threading
+from contextlib import closing
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Optional, TypedDict
+from typing import IO, TYPE_CHECKING, Dict, Optional, TypedDict
 
 from botocore.exceptions import ClientError
 
@@ -78,9 +79,19 @@ class S3Code:
     code_size: int
 
     def get_lambda_archive(self) -> bytes:
+        with closing(self.open_lambda_archive()) as archive:
+            return archive.read()
+
+    def open_lambda_archive(self) -> IO[bytes]:
+        """
+        Open the lambda archive as a binary stream, without loading it into memory at once.
+        The caller is responsible for closing the returned stream.
+
+        :return: Readable binary stream of the zip archive
+        """
         s3_client: "S3Client" = aws_stack.connect_to_service("s3", region_name="us-east-1")
         kwargs = {"VersionId": self.s3_object_version} if self.s3_object_version else {}
-        return s3_client.get_object(Bucket=self.s3_bucket, Key=self.s3_key, **kwargs)["Body"].read()
+        return s3_client.get_object(Bucket=self.s3_bucket, Key=self.s3_key, **kwargs)["Body"]
 
     def generate_presigned_url(self) -> str:
         s3_client: "S3Client" = aws_stack.connect_to_service("s3", region_name="us-east-1")
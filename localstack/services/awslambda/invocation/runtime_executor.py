@@ -83,6 +83,22 @@ class RuntimeExecutor(ABC):
         """
         pass
 
+    @classmethod
+    def prefetch_runtimes(cls) -> None:
+        """
+        Prefetch resources of the configured runtimes (LAMBDA_PREFETCH_RUNTIMES), to reduce the time of the first
+        version preparation. Should not block the caller.
+        """
+        pass
+
+    @classmethod
+    def stop_background_tasks(cls) -> None:
+        """
+        Stop background tasks of the executor (like image prefetches), including queued ones.
+        Called when LocalStack shuts down, so it should not block the caller.
+        """
+        pass
+
     @classmethod
     @abstractmethod
     def cleanup_version(cls, function_version: FunctionVersion):
@@ -159,6 +159,7 @@ from localstack.services.awslambda.invocation.lambda_service import (
     store_s3_bucket_archive,
 )
 from localstack.services.awslambda.invocation.models import LambdaStore
+from localstack.services.awslambda.invocation.runtime_executor import get_runtime_executor
 from localstack.services.plugins import ServiceLifecycleHook
 from localstack.utils.collections import PaginatedList
 from localstack.utils.strings import get_random_hex, long_uid, short_uid, to_bytes, to_str
@@ -181,6 +182,7 @@ class LambdaProvider(LambdaApi, ServiceLifecycleHook):
 
     def on_before_stop(self) -> None:
         self.lambda_service.stop()
+        get_runtime_executor().stop_background_tasks()
 
     @staticmethod
     def _get_function(function_name: str, account_id: str, region: str):
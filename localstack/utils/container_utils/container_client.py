@@ -25,6 +25,9 @@ from localstack.utils.strings import short_uid
 
 LOG = logging.getLogger(__name__)
 
+# buffer size used when copying file contents into tar streams (e.g. for copying files into containers)
+TAR_COPY_BUFFER_SIZE = 256 * 1024
+
 
 @unique
 class DockerContainerStatus(Enum):
@@ -280,6 +283,7 @@ SimpleVolumeBind = Tuple[str, str]
 class VolumeBind:
     """Represents a --volume argument run/create command. When using VolumeBind to bind-mount a file or directory
     that does not yet exist on the Docker host, -v creates the endpoint for you. It is always created as a directory.
+    Options (e.g. ["ro"] for a read-only mount) are passed on as comma-separated list.
     """
 
     host_dir: str
@@ -298,10 +302,14 @@ class VolumeBind:
         args.append(self.container_dir)
 
         if self.options:
-            args.append(self.options)
+            args.append(",".join(self.options))
 
         return ":".join(args)
 
+    @property
+    def read_only(self) -> bool:
+        return bool(self.options) and "ro" in self.options
+
 
 class VolumeMappings:
     mappings: List[Union[SimpleVolumeBind, VolumeBind]]
@@ -689,7 +697,7 @@ class ContainerClient(metaclass=ABCMeta):
         tty: bool = False,
         detach: bool = False,
         command: Optional[Union[List[str], str]] = None,
-        mount_volumes: Optional[List[SimpleVolumeBind]] = None,
+        mount_volumes: Optional[List[Union[SimpleVolumeBind, VolumeBind]]] = None,
         ports: Optional[PortMappings] = None,
         env_vars: Optional[Dict[str, str]] = None,
         user: Optional[str] = None,
@@ -721,7 +729,7 @@ class ContainerClient(metaclass=ABCMeta):
         tty: bool = False,
         detach: bool = False,
         command: Optional[Union[List[str], str]] = None,
-        mount_volumes: Optional[List[SimpleVolumeBind]] = None,
+        mount_volumes: Optional[List[Union[SimpleVolumeBind, VolumeBind]]] = None,
         ports: Optional[PortMappings] = None,
         env_vars: Optional[Dict[str, str]] = None,
         user: Optional[str] = None,
@@ -831,7 +839,7 @@ class Util:
     @staticmethod
     def tar_path(path, target_path, is_dir: bool):
         f = tempfile.NamedTemporaryFile()
-        with tarfile.open(mode="w", fileobj=f) as t:
+        with tarfile.open(mode="w", fileobj=f, copybufsize=TAR_COPY_BUFFER_SIZE) as t:
             abs_path = os.path.abspath(path)
             arcname = (
                 os.path.basename(path)
@@ -961,15 +969,26 @@ class Util:
 
     @staticmethod
     def convert_mount_list_to_dict(
-        mount_volumes: List[SimpleVolumeBind],
+        mount_volumes: List[Union[SimpleVolumeBind, VolumeBind]],
     ) -> Dict[str, Dict[str, str]]:
-        """Converts a List of (host_path, container_path) tuples to a Dict suitable as volume argument for docker sdk"""
-        return dict(
-            map(
-                lambda paths: (str(paths[0]), {"bind": paths[1], "mode": "rw"}),
-                mount_volumes,
-            )
-        )
+        """
+        Converts a List of (host_path, container_path) tuples or VolumeBind objects to a Dict suitable as volume
+        argument for docker sdk. Tuples are mounted read-write, VolumeBinds read-only if they have the "ro" option.
+        """
+
+        def _to_entry(
+            mount_volume: Union[SimpleVolumeBind, VolumeBind]
+        ) -> Tuple[str, Dict[str, str]]:
+            if isinstance(mount_volume, VolumeBind):
+                mode = "ro" if mount_volume.read_only else "rw"
+                return str(mount_volume.host_dir), {
+                    "bind": mount_volume.container_dir,
+                    "mode": mode,
+                }
+            host_path, container_path = mount_volume
+            return str(host_path), {"bind": container_path, "mode": "rw"}
+
+        return dict(map(_to_entry, mount_volumes))
 
     @staticmethod
     def resolve_dockerfile_path(dockerfile_path: str) -> str:
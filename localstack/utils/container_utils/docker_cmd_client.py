@@ -22,6 +22,7 @@ from localstack.utils.container_utils.container_client import (
     RegistryConnectionError,
     SimpleVolumeBind,
     Util,
+    VolumeBind,
 )
 from localstack.utils.run import run
 from localstack.utils.strings import to_str
@@ -589,7 +590,7 @@ class CmdDockerClient(ContainerClient):
         tty: bool = False,
         detach: bool = False,
         command: Optional[Union[List[str], str]] = None,
-        mount_volumes: Optional[List[SimpleVolumeBind]] = None,
+        mount_volumes: Optional[List[Union[SimpleVolumeBind, VolumeBind]]] = None,
         ports: Optional[PortMappings] = None,
         env_vars: Optional[Dict[str, str]] = None,
         user: Optional[str] = None,
@@ -613,11 +614,20 @@ class CmdDockerClient(ContainerClient):
         if privileged:
             cmd += ["--privileged"]
         if mount_volumes:
+            simple_volumes = [
+                volume for volume in mount_volumes if not isinstance(volume, VolumeBind)
+            ]
             cmd += [
                 volume
-                for host_path, docker_path in dict(mount_volumes).items()
+                for host_path, docker_path in dict(simple_volumes).items()
                 for volume in ["-v", f"{host_path}:{docker_path}"]
             ]
+            cmd += [
+                flag
+                for volume in mount_volumes
+                if isinstance(volume, VolumeBind)
+                for flag in ["-v", volume.to_str()]
+            ]
         if interactive:
             cmd.append("--interactive")
         if tty:
@@ -24,6 +24,7 @@ from localstack.utils.container_utils.container_client import (
     RegistryConnectionError,
     SimpleVolumeBind,
     Util,
+    VolumeBind,
 )
 from localstack.utils.strings import to_bytes, to_str
 from localstack.utils.threads import start_worker_thread
@@ -494,7 +495,7 @@ class SdkDockerClient(ContainerClient):
         tty: bool = False,
         detach: bool = False,
         command: Optional[Union[List[str], str]] = None,
-        mount_volumes: Optional[List[SimpleVolumeBind]] = None,
+        mount_volumes: Optional[List[Union[SimpleVolumeBind, VolumeBind]]] = None,
         ports: Optional[PortMappings] = None,
         env_vars: Optional[Dict[str, str]] = None,
         user: Optional[str] = None,
@@ -574,7 +575,7 @@ class SdkDockerClient(ContainerClient):
         tty: bool = False,
         detach: bool = False,
         command: Optional[Union[List[str], str]] = None,
-        mount_volumes: Optional[List[SimpleVolumeBind]] = None,
+        mount_volumes: Optional[List[Union[SimpleVolumeBind, VolumeBind]]] = None,
         ports: Optional[PortMappings] = None,
         env_vars: Optional[Dict[str, str]] = None,
         user: Optional[str] = None,
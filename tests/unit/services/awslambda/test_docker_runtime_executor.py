@@ -0,0 +1,546 @@
+import errno
+import io
+import os
+import socket
+import stat
+import tempfile
+import threading
+import time
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from localstack.services.awslambda.invocation import docker_runtime_executor
+from localstack.services.awslambda.invocation.docker_runtime_executor import (
+    DockerRuntimeExecutor,
+    _get_known_images,
+    _PortPool,
+    extract_archive,
+    fast_copy,
+    get_code_path_for_function,
+    get_path_for_function,
+    get_path_for_runtime_image,
+    get_prebuilt_image_name_for_runtime,
+    prepare_image,
+    pull_image_if_missing,
+)
+from localstack.services.awslambda.invocation.lambda_models import (
+    FunctionVersion,
+    VersionIdentifier,
+)
+from localstack.utils.container_utils.container_client import VolumeBind
+
+
+@pytest.fixture
+def container_client(monkeypatch):
+    """Replaces the container client of the docker runtime executor, and resets its module-level image caches"""
+    client = mock.MagicMock()
+    client.get_docker_image_names.return_value = []
+    monkeypatch.setattr(docker_runtime_executor, "CONTAINER_CLIENT", client)
+    monkeypatch.setattr(docker_runtime_executor, "_image_list_cache", None)
+    monkeypatch.setattr(docker_runtime_executor, "_image_locks", defaultdict(threading.Lock))
+    return client
+
+
+@pytest.fixture
+def function_version():
+    return FunctionVersion(
+        id=VersionIdentifier(
+            function_name="test-function",
+            qualifier="$LATEST",
+            region="us-east-1",
+            account="000000000000",
+        ),
+        config=mock.MagicMock(internal_revision="revision", runtime="python3.9"),
+    )
+
+
+def _create_zip(members: dict[str, tuple[bytes, int]]) -> bytes:
+    """Creates a zip archive from a mapping of member names to (content, unix mode)"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for name, (content, mode) in members.items():
+            info = zipfile.ZipInfo(name)
+            info.external_attr = mode << 16
+            zip_file.writestr(info, content)
+    return buffer.getvalue()
+
+
+class TestExtractArchive:
+    def test_extract_preserves_permissions(self, tmp_path):
+        archive = _create_zip(
+            {
+                "bootstrap": (b"#!/bin/sh", stat.S_IFREG | 0o755),
+                "handler.py": (b"def handler(event, context): pass", stat.S_IFREG | 0o644),
+            }
+        )
+
+        extract_archive(io.BytesIO(archive), tmp_path)
+
+        assert (tmp_path / "bootstrap").read_bytes() == b"#!/bin/sh"
+        assert stat.S_IMODE((tmp_path / "bootstrap").stat().st_mode) == 0o755
+        assert stat.S_IMODE((tmp_path / "handler.py").stat().st_mode) == 0o644
+
+    def test_extract_restores_symlinks(self, tmp_path):
+        archive = _create_zip(
+            {
+                "node_modules/pkg/cli.js": (b"console.log('hi')", stat.S_IFREG | 0o755),
+                "node_modules/.bin/cli": (b"../pkg/cli.js", stat.S_IFLNK | 0o777),
+            }
+        )
+
+        extract_archive(io.BytesIO(archive), tmp_path)
+
+        link = tmp_path / "node_modules" / ".bin" / "cli"
+        assert link.is_symlink()
+        assert os.readlink(link) == "../pkg/cli.js"
+        assert link.read_bytes() == b"console.log('hi')"
+
+    def test_extract_does_not_write_through_symlinks(self, tmp_path):
+        target = tmp_path / "target"
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        archive = _create_zip(
+            {
+                "evil": (str(outside).encode(), stat.S_IFLNK | 0o777),
+                "evil/pwned.txt": (b"pwned", stat.S_IFREG | 0o644),
+            }
+        )
+
+        extract_archive(io.BytesIO(archive), target)
+
+        assert (target / "evil").is_symlink()
+        assert not (outside / "pwned.txt").exists()
+
+    def test_extract_skips_members_outside_of_target(self, tmp_path):
+        target = tmp_path / "target"
+        archive = _create_zip(
+            {
+                "../outside.txt": (b"outside", stat.S_IFREG | 0o644),
+                "nested/../../outside.txt": (b"outside", stat.S_IFREG | 0o644),
+                "handler.py": (b"def handler(event, context): pass", stat.S_IFREG | 0o644),
+            }
+        )
+
+        extract_archive(io.BytesIO(archive), target)
+
+        assert not (tmp_path / "outside.txt").exists()
+        assert [path.name for path in target.iterdir()] == ["handler.py"]
+
+    def test_reextract_into_populated_directory(self, tmp_path):
+        archive = _create_zip(
+            {
+                "node_modules/pkg/cli.js": (b"console.log('hi')", stat.S_IFREG | 0o755),
+                "node_modules/.bin/cli": (b"../pkg/cli.js", stat.S_IFLNK | 0o777),
+            }
+        )
+
+        extract_archive(io.BytesIO(archive), tmp_path)
+        extract_archive(io.BytesIO(archive), tmp_path)
+
+        link = tmp_path / "node_modules" / ".bin" / "cli"
+        assert os.readlink(link) == "../pkg/cli.js"
+        assert (tmp_path / "node_modules" / "pkg" / "cli.js").read_bytes() == b"console.log('hi')"
+
+    def test_extract_falls_back_to_unzip_on_bad_crc(self, tmp_path):
+        content = b"some content with a checksum"
+        archive = _create_zip({"file.txt": (content, stat.S_IFREG | 0o644)})
+        # corrupt the stored (uncompressed) file content, which invalidates its CRC
+        corrupted = archive.replace(content, content.upper())
+
+        extracted_archives = []
+
+        def _unzip(path, target_dir):
+            with open(path, "rb") as f:
+                extracted_archives.append((f.read(), target_dir))
+
+        with mock.patch.object(docker_runtime_executor, "unzip", side_effect=_unzip):
+            extract_archive(io.BytesIO(corrupted), tmp_path)
+
+        assert extracted_archives == [(corrupted, str(tmp_path))]
+
+
+class TestFastCopy:
+    @pytest.fixture
+    def source_file(self, tmp_path):
+        source = tmp_path / "source"
+        # larger than the copy buffer, to require multiple chunks in the fallback
+        source.write_bytes(os.urandom(3 * docker_runtime_executor.COPY_BUFFER_SIZE + 17))
+        return source
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range not available")
+    def test_copy_file_range(self, source_file, tmp_path, monkeypatch):
+        copy_file_range = mock.MagicMock(side_effect=os.copy_file_range)
+        sendfile = mock.MagicMock(side_effect=os.sendfile)
+        monkeypatch.setattr(os, "copy_file_range", copy_file_range)
+        monkeypatch.setattr(os, "sendfile", sendfile)
+        target = tmp_path / "target"
+
+        fast_copy(source_file, target)
+
+        assert target.read_bytes() == source_file.read_bytes()
+        copy_file_range.assert_called()
+        sendfile.assert_not_called()
+
+    def test_sendfile_fallback(self, source_file, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            os,
+            "copy_file_range",
+            mock.MagicMock(side_effect=OSError(errno.EXDEV, "EXDEV")),
+            raising=False,
+        )
+        sendfile = mock.MagicMock(side_effect=os.sendfile)
+        monkeypatch.setattr(os, "sendfile", sendfile)
+        target = tmp_path / "target"
+
+        fast_copy(source_file, target)
+
+        assert target.read_bytes() == source_file.read_bytes()
+        sendfile.assert_called()
+
+    def test_copyfileobj_fallback(self, source_file, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            os,
+            "copy_file_range",
+            mock.MagicMock(side_effect=OSError(errno.EXDEV, "EXDEV")),
+            raising=False,
+        )
+        monkeypatch.setattr(
+            os, "sendfile", mock.MagicMock(side_effect=OSError(errno.EINVAL, "EINVAL"))
+        )
+        target = tmp_path / "target"
+
+        fast_copy(source_file, target)
+
+        assert target.read_bytes() == source_file.read_bytes()
+
+    def test_copy_empty_file(self, tmp_path):
+        source = tmp_path / "source"
+        source.write_bytes(b"")
+        target = tmp_path / "target"
+
+        fast_copy(source, target)
+
+        assert target.read_bytes() == b""
+
+
+class TestImageCache:
+    def test_image_list_is_cached(self, container_client):
+        container_client.get_docker_image_names.return_value = ["image-a:latest"]
+
+        assert _get_known_images() == {"image-a:latest"}
+        assert _get_known_images() == {"image-a:latest"}
+
+        container_client.get_docker_image_names.assert_called_once_with(strip_latest=False)
+
+    def test_image_list_is_refreshed_after_ttl(self, container_client, monkeypatch):
+        monkeypatch.setattr(
+            docker_runtime_executor, "_image_list_cache", (time.monotonic() - 60, {"old:latest"})
+        )
+        container_client.get_docker_image_names.return_value = ["new:latest"]
+
+        assert _get_known_images(ttl=30) == {"new:latest"}
+        container_client.get_docker_image_names.assert_called_once()
+
+    def test_pulled_image_is_added_to_cache(self, container_client):
+        pull_image_if_missing("image-a")
+
+        container_client.pull_image.assert_called_once_with("image-a")
+        assert "image-a" in _get_known_images()
+        # neither the image list nor the image are fetched again
+        pull_image_if_missing("image-a")
+        container_client.pull_image.assert_called_once()
+        container_client.get_docker_image_names.assert_called_once()
+
+    def test_existing_image_is_not_pulled(self, container_client):
+        container_client.get_docker_image_names.return_value = ["image-a"]
+
+        pull_image_if_missing("image-a")
+
+        container_client.pull_image.assert_not_called()
+
+    def test_concurrent_pulls_of_same_image_pull_once(self, container_client):
+        def _pull(image_name):
+            # give the other threads time to queue up on the image lock
+            time.sleep(0.1)
+
+        container_client.pull_image.side_effect = _pull
+        threads = [
+            threading.Thread(target=pull_image_if_missing, args=("image-a",)) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        container_client.pull_image.assert_called_once_with("image-a")
+
+
+class TestCleanupVersion:
+    def test_cleanup_removes_function_directory(self, function_version, tmp_path, monkeypatch):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        cleanup_executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(docker_runtime_executor, "CLEANUP_EXECUTOR", cleanup_executor)
+        function_path = get_path_for_function(function_version)
+        (function_path / "code" / "nested").mkdir(parents=True)
+        (function_path / "code" / "nested" / "handler.py").write_text("def handler(): pass")
+
+        DockerRuntimeExecutor.cleanup_version(function_version)
+
+        assert not function_path.exists()
+        # the single cleanup worker only runs the sentinel after the deletion has finished
+        cleanup_executor.submit(lambda: None).result(timeout=10)
+        assert not list(function_path.parent.glob(f"{function_path.name}.deleting-*"))
+        cleanup_executor.shutdown()
+
+    def test_cleanup_of_missing_directory_does_not_raise(
+        self, function_version, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+        DockerRuntimeExecutor.cleanup_version(function_version)
+
+        assert not get_path_for_function(function_version).exists()
+
+
+class TestPrepareImage:
+    @pytest.fixture(autouse=True)
+    def runtime_client(self, tmp_path, monkeypatch):
+        """Uses a fake runtime init and a temporary build context directory"""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        runtime_client_path = tmp_path / "aws-lambda-rie"
+        runtime_client_path.write_bytes(b"runtime init")
+        monkeypatch.setattr(
+            docker_runtime_executor, "get_runtime_client_path", lambda: runtime_client_path
+        )
+        monkeypatch.setattr(docker_runtime_executor, "get_runtime_client_hash", lambda: "hash")
+        monkeypatch.setattr(docker_runtime_executor, "_built_runtime_images", set())
+        get_prebuilt_image_name_for_runtime.cache_clear()
+        yield runtime_client_path
+        get_prebuilt_image_name_for_runtime.cache_clear()
+
+    def test_concurrent_prepares_build_once(self, container_client, function_version):
+        def _build(dockerfile_path, image_name):
+            # give the other threads time to queue up on the image lock
+            time.sleep(0.1)
+
+        container_client.build_image.side_effect = _build
+        threads = [
+            threading.Thread(target=prepare_image, args=(function_version,)) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        container_client.build_image.assert_called_once_with(
+            dockerfile_path=str(get_path_for_runtime_image("python3.9") / "Dockerfile"),
+            image_name=get_prebuilt_image_name_for_runtime("python3.9"),
+        )
+
+    def test_existing_image_is_reused(self, container_client, function_version):
+        image_name = get_prebuilt_image_name_for_runtime("python3.9")
+        container_client.get_docker_image_names.return_value = [image_name]
+
+        prepare_image(function_version)
+
+        container_client.build_image.assert_not_called()
+        assert image_name in docker_runtime_executor._built_runtime_images
+
+    def test_failed_build_is_retried(self, container_client, function_version):
+        container_client.build_image.side_effect = [Exception("build failed"), None]
+
+        prepare_image(function_version)
+        prepare_image(function_version)
+        prepare_image(function_version)
+
+        assert container_client.build_image.call_count == 2
+
+    def test_build_context_does_not_contain_function_code(
+        self, container_client, function_version, runtime_client
+    ):
+        prepare_image(function_version)
+
+        build_context = get_path_for_runtime_image("python3.9")
+        dockerfile = (build_context / "Dockerfile").read_text()
+        assert "COPY code/" not in dockerfile
+        assert "COPY aws-lambda-rie " in dockerfile
+        assert sorted(path.name for path in build_context.iterdir()) == [
+            "Dockerfile",
+            "aws-lambda-rie",
+        ]
+        assert (build_context / "aws-lambda-rie").read_bytes() == runtime_client.read_bytes()
+
+    def test_stale_images_are_removed_after_build(self, container_client, function_version):
+        image_name = get_prebuilt_image_name_for_runtime("python3.9")
+        stale_image = "localstack/lambda-runtime-python3.9:oldhash"
+        other_runtime_image = "localstack/lambda-runtime-nodejs16.x:oldhash"
+        container_client.get_docker_image_names.return_value = [stale_image, other_runtime_image]
+
+        prepare_image(function_version)
+
+        container_client.build_image.assert_called_once()
+        container_client.remove_image.assert_called_once_with(stale_image, force=False)
+        assert _get_known_images() == {image_name, other_runtime_image}
+
+    def test_failed_stale_image_removal_is_ignored(self, container_client, function_version):
+        container_client.get_docker_image_names.return_value = [
+            "localstack/lambda-runtime-python3.9:oldhash"
+        ]
+        container_client.remove_image.side_effect = Exception("image is in use")
+
+        prepare_image(function_version)
+
+        assert get_prebuilt_image_name_for_runtime("python3.9") in (
+            docker_runtime_executor._built_runtime_images
+        )
+
+
+class TestVolumeMappings:
+    def test_mounts_are_read_only(self, function_version, monkeypatch):
+        monkeypatch.setattr(
+            docker_runtime_executor,
+            "get_runtime_client_path",
+            lambda: Path("/opt/rie/aws-lambda-rie"),
+        )
+        monkeypatch.setattr(docker_runtime_executor.config, "LAMBDA_PREBUILD_IMAGES", False)
+        executor = mock.MagicMock(function_version=function_version)
+
+        volumes = list(DockerRuntimeExecutor._get_volume_mappings(executor))
+
+        assert [(volume.host_dir, volume.container_dir) for volume in volumes] == [
+            (str(get_code_path_for_function(function_version)), "/var/task"),
+            ("/opt/rie/aws-lambda-rie", "/var/rapid/init"),
+        ]
+        assert all(isinstance(volume, VolumeBind) and volume.read_only for volume in volumes)
+
+
+class TestPortPool:
+    def test_acquired_ports_are_distinct(self):
+        pool = _PortPool(batch_size=4)
+
+        ports = [pool.acquire() for _ in range(10)]
+
+        assert len(set(ports)) == 10
+
+    def test_port_in_use_is_not_handed_out_again(self):
+        pool = _PortPool(batch_size=2)
+        port = pool.acquire()
+
+        other_ports = {pool.acquire() for _ in range(10)}
+
+        assert port not in other_ports
+
+    def test_released_port_is_reused(self):
+        pool = _PortPool(batch_size=4)
+        port = pool.acquire()
+
+        pool.release(port)
+
+        assert pool.acquire() == port
+
+    def test_releasing_unknown_port_is_ignored(self):
+        pool = _PortPool(batch_size=4)
+        port = pool.acquire()
+        pool.release(port)
+
+        # a second release must not add the port to the pool twice
+        pool.release(port)
+
+        assert pool.acquire() == port
+        assert pool.acquire() != port
+
+    def test_port_taken_in_the_meantime_is_skipped(self):
+        pool = _PortPool(batch_size=4)
+        port = pool.acquire()
+        pool.release(port)
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as tcp:
+            tcp.bind(("", port))
+            assert pool.acquire() != port
+
+    def test_stop_keeps_port_of_hanging_endpoint(self, container_client, monkeypatch):
+        pool = _PortPool(batch_size=1)
+        monkeypatch.setattr(docker_runtime_executor, "_PORT_POOL", pool)
+        monkeypatch.setattr(docker_runtime_executor, "ENDPOINT_SHUTDOWN_TIMEOUT", 0.1)
+        shutdown_finished = threading.Event()
+        executor = mock.MagicMock(id="hanging-endpoint")
+        executor.executor_endpoint.port = pool.acquire()
+        executor._shutdown_executor_endpoint.side_effect = lambda: shutdown_finished.wait(10)
+
+        DockerRuntimeExecutor.stop(executor)
+
+        assert pool.acquire() != executor.executor_endpoint.port
+        shutdown_finished.set()
+        for thread in threading.enumerate():
+            if thread.name == "lambda-endpoint-shutdown-hanging-endpoint":
+                thread.join(timeout=5)
+
+    def test_stop_releases_port_of_stopped_endpoint(self, container_client, monkeypatch):
+        pool = _PortPool(batch_size=1)
+        monkeypatch.setattr(docker_runtime_executor, "_PORT_POOL", pool)
+        executor = mock.MagicMock(id="stopped-endpoint")
+        executor.executor_endpoint.port = pool.acquire()
+
+        DockerRuntimeExecutor.stop(executor)
+
+        assert pool.acquire() == executor.executor_endpoint.port
+
+
+class TestEagerPrefetch:
+    @pytest.fixture
+    def image_executors(self, monkeypatch):
+        """Replaces the module-level image executors with local ones, which are shut down after the test"""
+        pull_executor = ThreadPoolExecutor(max_workers=2)
+        prefetch_executor = ThreadPoolExecutor(max_workers=4)
+        monkeypatch.setattr(docker_runtime_executor, "IMAGE_PULL_EXECUTOR", pull_executor)
+        monkeypatch.setattr(docker_runtime_executor, "IMAGE_PREFETCH_EXECUTOR", prefetch_executor)
+        yield pull_executor, prefetch_executor
+        pull_executor.shutdown()
+        prefetch_executor.shutdown()
+
+    def test_prefetch_does_not_block_function_image_pulls(
+        self, container_client, image_executors, monkeypatch
+    ):
+        pull_executor, prefetch_executor = image_executors
+        monkeypatch.setattr(
+            docker_runtime_executor.config, "LAMBDA_PREFETCH_RUNTIMES", ["python3.9", "nodejs16.x"]
+        )
+        prefetch_release = threading.Event()
+        prefetch_images = {
+            docker_runtime_executor.get_image_for_runtime(runtime)
+            for runtime in ("python3.9", "nodejs16.x")
+        }
+
+        def _pull(image_name):
+            if image_name in prefetch_images:
+                prefetch_release.wait(10)
+
+        container_client.pull_image.side_effect = _pull
+
+        docker_runtime_executor.eager_prefetch_images()
+        # the pull for a created function completes while all prefetches are still pulling
+        pull_executor.submit(pull_image_if_missing, "function-image").result(timeout=5)
+
+        prefetch_release.set()
+        prefetch_executor.shutdown()
+        assert {c.args[0] for c in container_client.pull_image.call_args_list} == {
+            "function-image",
+            *prefetch_images,
+        }
+
+    def test_stop_background_tasks_cancels_queued_pulls(self, image_executors):
+        _, prefetch_executor = image_executors
+        pull_release = threading.Event()
+        running_pulls = [prefetch_executor.submit(pull_release.wait, 10) for _ in range(4)]
+        queued_pull = prefetch_executor.submit(pull_release.wait, 10)
+
+        DockerRuntimeExecutor.stop_background_tasks()
+        pull_release.set()
+
+        assert queued_pull.cancelled()
+        assert all(pull.result(timeout=5) for pull in running_pulls)
@@ -11,6 +11,7 @@ from localstack.utils.container_utils.container_client import (
     DockerContainerStatus,
     PortMappings,
     Util,
+    VolumeBind,
 )
 from localstack.utils.container_utils.docker_cmd_client import CmdDockerClient
 
@@ -118,6 +119,42 @@ def test_argument_parsing():
     assert network == "mynet123"
 
 
+class TestVolumeMounts:
+    def test_volume_bind_to_str(self):
+        assert VolumeBind("/host", "/container").to_str() == "/host:/container"
+        assert VolumeBind("/host", "/container", options=["ro"]).to_str() == "/host:/container:ro"
+        assert (
+            VolumeBind("/host", "/container", options=["ro", "z"]).to_str()
+            == "/host:/container:ro,z"
+        )
+
+    def test_convert_mount_list_to_dict(self):
+        mounts = [
+            ("/host/rw", "/container/rw"),
+            VolumeBind("/host/bind", "/container/bind"),
+            VolumeBind("/host/ro", "/container/ro", options=["ro"]),
+        ]
+        assert Util.convert_mount_list_to_dict(mounts) == {
+            "/host/rw": {"bind": "/container/rw", "mode": "rw"},
+            "/host/bind": {"bind": "/container/bind", "mode": "rw"},
+            "/host/ro": {"bind": "/container/ro", "mode": "ro"},
+        }
+
+    def test_cmd_client_volume_options(self):
+        cmd, _ = CmdDockerClient()._build_run_create_cmd(
+            "create",
+            "test-image",
+            mount_volumes=[
+                ("/host/rw", "/container/rw"),
+                VolumeBind("/host/ro", "/container/ro", options=["ro"]),
+                VolumeBind("/host/selinux", "/container/selinux", options=["ro", "z"]),
+            ],
+        )
+        assert list_in(["-v", "/host/rw:/container/rw"], cmd)
+        assert list_in(["-v", "/host/ro:/container/ro:ro"], cmd)
+        assert list_in(["-v", "/host/selinux:/container/selinux:ro,z"], cmd)
+
+
 def list_in(a, b):
     return len(a) <= len(b) and any(
         map(lambda x: b[x : x + len(a)] == a, range(len(b) - len(a) + 1))